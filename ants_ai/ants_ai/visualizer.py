@@ -1,29 +1,42 @@
+import functools
 import importlib.resources
 import json
 import os
-import re
-from abc import ABC, abstractmethod
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional, Self
 
+import numpy as np
+
+# orjson decodes large replays several times faster than the stdlib, but it's
+# optional; fall back to the stdlib parser when it's not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Hide the annoying pygame support prompt
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 import pygame
 
+# Colors are pre-built `pygame.Color` objects so draw calls skip the
+# per-call tuple-to-color coercion
 PLAYER_COLORS = {
-    0: (212, 17, 50),
-    1: (232, 110, 48),
-    2: (230, 179, 25),
-    3: (246, 246, 85),
-    4: (166, 229, 153),
-    5: (46, 184, 126),
-    6: (48, 140, 232),
-    7: (99, 23, 207),
-    8: (214, 92, 214),
-    9: (207, 175, 183),
+    0: pygame.Color(212, 17, 50),
+    1: pygame.Color(232, 110, 48),
+    2: pygame.Color(230, 179, 25),
+    3: pygame.Color(246, 246, 85),
+    4: pygame.Color(166, 229, 153),
+    5: pygame.Color(46, 184, 126),
+    6: pygame.Color(48, 140, 232),
+    7: pygame.Color(99, 23, 207),
+    8: pygame.Color(214, 92, 214),
+    9: pygame.Color(207, 175, 183),
 }
+FOOD_COLOR = pygame.Color(153, 145, 102)
 UPDATE_EPSILON = 0.001
 REFERENCE_WINDOW_SIZE = 800
 REFERENCE_FONT_SIZE = 20
@@ -33,6 +46,145 @@ SCORES_LABEL = "Scores: "
 HIVE_LABEL = "Hive: "
 INFO_LABEL_OFFSET = 10
 
+# Map tile characters as byte values, for the vectorized map parser
+_ORD_ZERO = ord("0")
+_ORD_NINE = ord("9")
+_ORD_FOOD = ord("*")
+_ORD_WATER = ord("%")
+_ORD_LAND = ord(".")
+
+
+# Caches of pre-rendered entity surfaces, keyed by their visual parameters.
+# Stamps are rendered once and blitted many times, so the per-frame cost of an
+# entity is a single blit instead of a primitive rasterization.
+_ANT_STAMPS: dict[tuple[int, int, int], pygame.Surface] = {}
+_FOOD_STAMPS: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _gil_disabled() -> bool:
+    """Returns whether the interpreter is running without the GIL.
+
+    :return: `True` on free-threaded builds, `False` otherwise.
+    :rtype: bool
+    """
+    try:
+        return not sys._is_gil_enabled()
+    except AttributeError:
+        # Builds without the attribute predate free-threading
+        return False
+
+
+def _intern_location(location: list[int], cache: dict) -> tuple[int]:
+    """Returns a shared tuple for the given location.
+
+    Events reference the same few (row, col) coordinates over and over across
+    a replay, so sharing one tuple per coordinate cuts allocations and peak
+    memory during loading.
+
+    :param location: The location as a (row, col) list.
+    :type location: list[int]
+    :param cache: The cache of previously interned locations.
+    :type cache: dict
+    :return: The interned location tuple.
+    :rtype: tuple[int]
+    """
+    location = tuple(location)
+    return cache.setdefault(location, location)
+
+
+@functools.lru_cache(maxsize=8)
+def _classify_map(contents: str) -> tuple[tuple, tuple, tuple]:
+    """Classifies the map tiles into hill, food and water coordinates.
+
+    The result depends only on the map contents, so it's cached to avoid
+    re-parsing when several visualizers are created for the same replay.
+
+    :param contents: The contents of the map.
+    :type contents: str
+    :return: Tuples of (row, col, player) hills, (row, col) food and (row, col) water.
+    :rtype: tuple[tuple, tuple, tuple]
+    :raises ValueError: If the map contains an invalid character.
+    """
+    # Map rows are the lines prefixed with "m "; plain byte slicing is all
+    # that's needed to extract them, and bytes feed np.frombuffer directly
+    lines = [
+        line[2:].strip()
+        for line in contents.encode().splitlines()
+        if line.startswith(b"m ")
+    ]
+
+    # Classify every tile at once with vectorized masks instead of a
+    # per-character Python loop
+    chars = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1)
+    # Max 10 players
+    hills = (chars >= _ORD_ZERO) & (chars <= _ORD_NINE)
+    food = chars == _ORD_FOOD
+    water = chars == _ORD_WATER
+    land = chars == _ORD_LAND
+
+    invalid = ~(hills | food | water | land)
+    if invalid.any():
+        row, col = np.argwhere(invalid)[0]
+        raise ValueError(
+            f"Invalid entity in map with character value: {chr(chars[row, col])}"
+        )
+
+    return (
+        tuple(
+            (int(row), int(col), int(chars[row, col]) - _ORD_ZERO)
+            for row, col in np.argwhere(hills)
+        ),
+        tuple((int(row), int(col)) for row, col in np.argwhere(food)),
+        tuple((int(row), int(col)) for row, col in np.argwhere(water)),
+    )
+
+
+def _ant_stamp(player: int, size: int, scale: int) -> pygame.Surface:
+    """Returns a cached surface with an ant of the given player and size pre-rendered.
+
+    :param player: The player that owns the ant.
+    :type player: int
+    :param size: The radius of the ant.
+    :type size: int
+    :param scale: The scale of the ant on the screen.
+    :type scale: int
+    :return: The pre-rendered ant surface.
+    :rtype: pygame.Surface
+    """
+    key = (player, size, scale)
+    stamp = _ANT_STAMPS.get(key)
+
+    if stamp is None:
+        stamp = pygame.Surface((scale, scale), pygame.SRCALPHA)
+        pygame.draw.circle(
+            stamp, PLAYER_COLORS[player], (scale // 2, scale // 2), size
+        )
+        _ANT_STAMPS[key] = stamp
+
+    return stamp
+
+
+def _food_stamp(size: int, scale: int) -> pygame.Surface:
+    """Returns a cached surface with food of the given size pre-rendered.
+
+    :param size: The size of the food.
+    :type size: int
+    :param scale: The scale of the food on the screen.
+    :type scale: int
+    :return: The pre-rendered food surface.
+    :rtype: pygame.Surface
+    """
+    key = (size, scale)
+    stamp = _FOOD_STAMPS.get(key)
+
+    if stamp is None:
+        stamp = pygame.Surface((scale, scale), pygame.SRCALPHA)
+        offset = (scale - size) // 2
+        pygame.draw.rect(stamp, FOOD_COLOR, (offset, offset, size, size))
+        _FOOD_STAMPS[key] = stamp
+
+    return stamp
+
 
 class TurnPhase(Enum):
     """An enumeration representing the different phases of a turn."""
@@ -47,7 +199,7 @@ class TurnPhase(Enum):
         return [phase for phase in TurnPhase]
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A class representing an event that occurred in the game.
 
@@ -74,7 +226,7 @@ class Event:
     """The destination of the entity as a tuple of (row, col). Only used for "Move" and "Attack" events."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A class representing a turn in the game.
 
@@ -98,19 +250,43 @@ class Turn:
     """A dictionary mapping turn phases to the events that occurred in that phase."""
 
     @classmethod
-    def from_json(cls, dict: dict[str, Any]) -> Self:
+    def from_json(
+        cls, dict: dict[str, Any], location_cache: Optional[dict] = None
+    ) -> Self:
         """Creates a `Turn` object from a JSON dictionary.
 
         :param dict: The JSON dictionary to create the `Turn` object from.
         :type dict: dict[str, Any]
+        :param location_cache: The cache of interned locations to share tuples through, defaults to `None`.
+        :type location_cache: Optional[dict], optional
         :return: The `Turn` object created from the JSON dictionary.
         :rtype: Self
         """
-        # Group events by phase
+        if location_cache is None:
+            location_cache = {}
+
+        # Group events by phase; events are constructed positionally since
+        # keyword unpacking costs a dict copy per event
         events = defaultdict(list)
         for event in dict["events"]:
             phase = TurnPhase(event["event_type"])
-            events[phase].append(Event(**event))
+            # Locations come out of JSON as lists; store them as interned
+            # tuples so consumers can use them as dict keys directly
+            destination = event["destination"]
+            events[phase].append(
+                Event(
+                    event["event_type"],
+                    event["entity"],
+                    event["entity_id"],
+                    event["player"],
+                    _intern_location(event["location"], location_cache),
+                    (
+                        _intern_location(destination, location_cache)
+                        if destination is not None
+                        else None
+                    ),
+                )
+            )
 
         return cls(
             dict["turn"],
@@ -121,7 +297,7 @@ class Turn:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Map:
     """A class representing the map of the game.
 
@@ -139,7 +315,7 @@ class Map:
     """The contents of the map."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Replay:
     """A class representing a replay of a full game.
 
@@ -172,7 +348,23 @@ class Replay:
         :return: The `Replay` object created from the JSON dictionary.
         :rtype: Self
         """
-        turns = list(map(lambda turn: Turn.from_json(turn), dict["turns"]))
+        # Share one location cache across the whole replay so repeated
+        # coordinates resolve to the same tuple
+        location_cache = {}
+
+        # Turns decode independently of each other, so fan them out across
+        # threads when the interpreter can actually run them in parallel
+        if _gil_disabled():
+            with ThreadPoolExecutor() as executor:
+                turns = list(
+                    executor.map(
+                        lambda turn: Turn.from_json(turn, location_cache),
+                        dict["turns"],
+                    )
+                )
+        else:
+            turns = [Turn.from_json(turn, location_cache) for turn in dict["turns"]]
+
         _map = Map(**dict["map"])
 
         return cls(
@@ -197,9 +389,9 @@ class Replay:
             return finished_reason
 
 
-@dataclass
-class Entity(ABC):
-    """An abstract class representing an entity in the game.
+@dataclass(slots=True)
+class Entity:
+    """A base class representing an entity in the game.
 
     Attributes:
         id: (str): The ID of the entity.
@@ -226,22 +418,32 @@ class Entity(ABC):
     alive: bool = False
     """Whether the entity is alive or not."""
 
-    @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draws the entity.
+    def blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Returns the blit pair for the entity, for batched drawing.
 
-        :param screen: The screen to draw the entity on.
-        :type screen: pygame.Surface
+        :return: The pre-rendered surface and the position to blit it at.
+        :rtype: tuple[pygame.Surface, tuple[int, int]]
         """
         raise NotImplementedError
 
-    def update(self, phase: int, dt: float) -> None:
+    def rect(self) -> pygame.Rect:
+        """Returns the rectangle of pixels currently covered by the entity.
+
+        :return: The rectangle covered by the entity.
+        :rtype: pygame.Rect
+        """
+        row, col = self.location
+        return pygame.Rect(col * self.scale, row * self.scale, self.scale, self.scale)
+
+    def update(self, phase: int, dt: float) -> bool:
         """Updates the entity.
 
         :param phase: The current phase.
         :type phase: int
         :param dt: The time since the last update.
         :type dt: float
+        :return: Whether the entity changed as a result of the update.
+        :rtype: bool
         """
         update_t = dt - phase
         phase = TurnPhase.all()[phase]
@@ -249,7 +451,7 @@ class Entity(ABC):
         if phase in [TurnPhase.Spawn, TurnPhase.Remove]:
             # Update the size
             if self.size == self.target_size:
-                return
+                return False
 
             size_update = (self.target_size - self.size) * update_t
             self.size += size_update
@@ -264,11 +466,21 @@ class Entity(ABC):
             # If the size is within UPDATE_EPSILON of the target size, snap to the target size
             if abs(self.size - self.target_size) <= UPDATE_EPSILON:
                 self.size = self.target_size
+
+            return True
         elif phase == TurnPhase.Move:
-            self.location = self._update_location(
+            location = self._update_location(
                 self.location, self.target_location, update_t
             )
 
+            if location == self.location:
+                return False
+
+            self.location = location
+            return True
+
+        return False
+
     def _update_location(
         self,
         location: tuple[int],
@@ -317,7 +529,7 @@ class Entity(ABC):
         return current_row, current_col
 
 
-@dataclass
+@dataclass(slots=True)
 class Ant(Entity):
     """A class representing an ant in the game.
 
@@ -328,80 +540,68 @@ class Ant(Entity):
     player: int = -1
     """The player that owns the ant."""
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
         row, col = self.location
-        color = PLAYER_COLORS[self.player]
-        radius = self.scale // 2
-        center = (col * self.scale + radius, row * self.scale + radius)
-        pygame.draw.circle(screen, color, center, self.size)
+        stamp = _ant_stamp(self.player, round(self.size), self.scale)
+        return stamp, (col * self.scale, row * self.scale)
 
 
-@dataclass
+@dataclass(slots=True)
 class Food(Entity):
-    """A class representing food in the game."""
+    """A class representing food in the game.
 
-    def draw(self, screen: pygame.Surface) -> None:
-        row, col = self.location
-        offset = (self.scale - self.size) // 2
-        rect = (
-            col * self.scale + offset,
-            row * self.scale + offset,
-            self.size,
-            self.size,
-        )
-        pygame.draw.rect(screen, (153, 145, 102), rect)
+    Attributes:
+        pixel_pos (tuple[int]): The pixel position of the food.
+    """
 
+    pixel_pos: tuple[int] = (0, 0)
+    """The pixel position of the food, precomputed since food never moves."""
 
-@dataclass
+    def blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        return _food_stamp(round(self.size), self.scale), self.pixel_pos
+
+
+@dataclass(slots=True)
 class Hill(Entity):
     """A class representing a hill in the game.
 
     Attributes:
         player (int): The player that owns the hill.
         sprites (tuple[pygame.Surface]): The sprites for the hill (alive and razed).
+        pixel_pos (tuple[int]): The pixel position of the hill.
     """
 
     player: int = -1
     """The player that owns the hill."""
     sprites: tuple[pygame.Surface] = (None, None)
-    """The sprites for the hill (alive and razed)."""
+    """The pre-composited sprites for the hill (alive and razed), already at scale."""
+    pixel_pos: tuple[int] = (0, 0)
+    """The pixel position of the hill, precomputed since hills never move."""
 
-    def draw(self, screen: pygame.Surface) -> None:
-        row, col = self.location
+    def blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
         sprite = self.sprites[0] if self.alive else self.sprites[1]
-        sprite = pygame.transform.scale(sprite, (self.scale, self.scale))
+        return sprite, self.pixel_pos
 
-        # Draw an outline of the player's color on the sprite to indicate ownership of the hill
-        # Only draw the outline if the hill is alive
-        if self.alive:
-            color = PLAYER_COLORS[self.player]
-            overlay = pygame.Surface((self.scale, self.scale), pygame.SRCALPHA)
-            center = (self.scale // 2, self.scale // 2)
-            radius = self.scale // 4
-            pygame.draw.circle(overlay, color, center, radius, width=3)
-            sprite.blit(overlay, (0, 0))
 
-        screen.blit(sprite, (col * self.scale, row * self.scale))
-
-
-@dataclass
+@dataclass(slots=True)
 class Water(Entity):
     """A class representing water in the game.
 
     Attributes:
         sprite: (pygame.Surface): The sprite to use for the water.
+        pixel_pos (tuple[int]): The pixel position of the water.
     """
 
     sprite: pygame.Surface = None
-    """The sprite to use for the water."""
+    """The sprite to use for the water, already at scale."""
+    pixel_pos: tuple[int] = (0, 0)
+    """The pixel position of the water, precomputed since water never moves."""
 
-    def draw(self, screen: pygame.Surface) -> None:
-        row, col = self.location
-        sprite = pygame.transform.scale(self.sprite, (self.scale, self.scale))
-        screen.blit(sprite, (col * self.scale, row * self.scale))
+    def blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        return self.sprite, self.pixel_pos
 
 
-@dataclass
+@dataclass(slots=True)
 class Attack(Entity):
     """A class representing an attack in the game.
 
@@ -412,6 +612,8 @@ class Attack(Entity):
     current_target_location: tuple[int] = (-1, -1)
     """The current target location of the attack that will be updated towards the target location."""
 
+    # Attacks are line primitives drawn directly by the visualizer, so they
+    # provide `draw` instead of `blit`
     def draw(self, screen: pygame.Surface) -> None:
         row, col = self.location
         dest_row, dest_col = self.current_target_location
@@ -425,13 +627,33 @@ class Attack(Entity):
             2,
         )
 
-    def update(self, phase, dt):
+    def update(self, phase, dt) -> bool:
         # Update the current _target_ location towards the target location
         update_t = dt - phase
-        self.current_target_location = self._update_location(
+        current_target_location = self._update_location(
             self.current_target_location, self.target_location, update_t
         )
 
+        if current_target_location == self.current_target_location:
+            return False
+
+        self.current_target_location = current_target_location
+        return True
+
+    def rect(self) -> pygame.Rect:
+        # The attack line spans from its location to its current target location
+        row, col = self.location
+        return pygame.Rect(
+            col * self.scale, row * self.scale, self.scale, self.scale
+        ).union(
+            pygame.Rect(
+                self.current_target_location[1] * self.scale,
+                self.current_target_location[0] * self.scale,
+                self.scale,
+                self.scale,
+            )
+        )
+
 
 class Visualizer:
     """A class for visualizing a replay of a full Ants game.
@@ -453,22 +675,12 @@ class Visualizer:
         pygame.init()
         pygame.display.set_caption("Ants Replay Visualizer")
 
-        self._hill_sprites = self._load_hill_sprites()
-        self._water_sprite = self._load_water_sprite()
-
         self._replay = self._load_replay(replay_filename)
         self._width = self._replay.map.width
         self._height = self._replay.map.height
         self._scale = scale
 
-        self._water: list[Water] = []
-        self._hills: dict[tuple[int], Hill] = {}
-        self._food: dict[tuple[int], Food] = {}
-        self._ants: dict[str, Ant] = {}
-        self._attacks: list[Attack] = []
-        self._parse_map()
-
-        self._land_color = (120, 89, 58)
+        self._land_color = pygame.Color(120, 89, 58)
         self._game_size = (self._width * self._scale, self._height * self._scale)
 
         with importlib.resources.path(
@@ -498,8 +710,53 @@ class Visualizer:
         )
 
         self._screen = pygame.display.set_mode(self._window_size)
-        self._game_screen = pygame.Surface(self._game_size)
-        self._info_screen = pygame.Surface(self._info_size)
+        # Staging surfaces are converted to the display format so the final
+        # per-frame blits to the window are straight copies
+        self._game_screen = pygame.Surface(self._game_size).convert()
+        self._info_screen = pygame.Surface(self._info_size).convert()
+
+        # Sprites are loaded after the display is created so `convert_alpha` can
+        # match them to the display format, which keeps per-frame blits from
+        # re-converting pixels
+        self._hill_sprites = self._load_hill_sprites()
+        # Scale the water sprite once; hill sprites are scaled per player at parse time
+        self._water_sprite = pygame.transform.scale(
+            self._load_water_sprite(), (scale, scale)
+        )
+
+        # Fully-grown entity sizes are scale-invariant; compute them once
+        # instead of re-dividing per spawn
+        self._ant_target_size = scale // 5
+        self._food_target_size = scale // 3
+
+        # Warm the ant stamp cache for every player at the fully-grown size so
+        # the first frames don't pay for surface creation
+        for player in PLAYER_COLORS:
+            _ant_stamp(player, self._ant_target_size, scale)
+
+        self._water: list[Water] = []
+        # Pre-composited (alive, razed) hill sprites, shared by all hills of a player
+        self._hill_cache: dict[int, tuple[pygame.Surface]] = {}
+        self._hills: dict[tuple[int], Hill] = {}
+        self._food: dict[tuple[int], Food] = {}
+        self._ants: dict[str, Ant] = {}
+        self._attacks: list[Attack] = []
+        self._parse_map()
+
+        # Dispatch table for spawn events so the replay loop doesn't walk a
+        # string-comparison chain on every event
+        self._spawn_dispatch = {
+            "Ant": self._replay_spawn_ant,
+            "Food": self._replay_spawn_food,
+        }
+
+        # Bake the static terrain (land fill plus water tiles) into a single
+        # background surface so each frame starts with one blit instead of a
+        # fill plus one blit per water tile
+        self._background = pygame.Surface(self._game_size)
+        self._background.fill(self._land_color)
+        self._background.blits([water.blit() for water in self._water], doreturn=False)
+        self._background = self._background.convert()
 
         self._clock = pygame.time.Clock()
         # Simulation time
@@ -508,6 +765,8 @@ class Visualizer:
         self._turn_time = 0.0
 
         self._show_grid = show_grid
+        # Whether the screen needs a redraw; starts dirty so the first frame is drawn
+        self._dirty = True
         self._turn_phases = TurnPhase.all()
         self._replayed: dict[int, dict[TurnPhase, bool]] = {
             turn: {phase: False for phase in self._turn_phases}
@@ -523,7 +782,9 @@ class Visualizer:
 
         while running:
             if finished:
-                running = not self._should_quit()
+                # The endgame scene is static, so block in the kernel until the
+                # next event arrives instead of spinning on the event queue
+                running = pygame.event.wait().type != pygame.QUIT
                 continue
 
             dt = self._clock.tick(60) / 1000.0
@@ -541,6 +802,8 @@ class Visualizer:
                 self._remove_dead_entities()
                 self._attacks.clear()
                 prev_turn = turn
+                # The info panel shows per-turn stats, so a turn change needs a redraw
+                self._dirty = True
 
                 # Check if the simulation has finished
                 finished = turn >= len(self._replay.turns)
@@ -558,20 +821,34 @@ class Visualizer:
 
             if not self._replayed[turn][phase]:
                 events = self._replay.turns[turn].events[phase]
-                self._do_replay(events)
+                if events:
+                    self._do_replay(events)
+                    self._dirty = True
                 self._replayed[turn][phase] = True
 
-            self._update_map(phase_index)
+            changed_rects = self._update_map(phase_index)
+
+            # Only redraw when something actually changed this frame
+            if self._dirty or changed_rects:
+                self._draw_info(turn, self._replay.turns[-1].turn_number)
+                self._draw_grid()
+                self._draw_map()
 
-            self._draw_info(turn, self._replay.turns[-1].turn_number)
-            self._draw_grid()
-            self._draw_map()
+                # Draw the full screen as a combination of the game and info surfaces
+                self._screen.blit(self._info_screen, (0, 0))
+                self._screen.blit(self._game_screen, (0, self._info_size[1]))
 
-            # Draw the full screen as a combination of the game and info surfaces
-            self._screen.blit(self._info_screen, (0, 0))
-            self._screen.blit(self._game_screen, (0, self._info_size[1]))
+                if self._dirty:
+                    # Turn changes and replayed events can touch the whole window
+                    pygame.display.update()
+                else:
+                    # Pure animation frames only need to push the changed pixels,
+                    # offset by the info panel the game surface is blitted under
+                    pygame.display.update(
+                        [rect.move(0, self._info_size[1]) for rect in changed_rects]
+                    )
 
-            pygame.display.flip()
+                self._dirty = False
 
             running = not self._should_quit()
 
@@ -726,15 +1003,33 @@ class Visualizer:
                 pygame.draw.rect(self._game_screen, (0, 0, 0), rect, 1)
 
     def _draw_map(self) -> None:
-        self._game_screen.fill(self._land_color)
-        for entity in [
-            *self._water,
-            *self._hills.values(),
-            *self._food.values(),
-            *self._ants.values(),
-            *self._attacks,
-        ]:
-            entity.draw(self._game_screen)
+        self._game_screen.blit(self._background, (0, 0))
+
+        # Batch all entity blits into a single call so the Python/C boundary is
+        # crossed once per frame instead of once per entity
+        self._game_screen.blits(
+            [
+                entity.blit()
+                for entity in [
+                    *self._hills.values(),
+                    *self._food.values(),
+                    *self._ants.values(),
+                ]
+            ],
+            doreturn=False,
+        )
+
+        # Attack lines are drawn as primitives since they cannot be batched as
+        # blits. Lock the surface once around the whole batch so each draw call
+        # doesn't pay its own lock/unlock pair. Blits must stay outside the
+        # locked region since locked surfaces cannot be blitted to.
+        if self._attacks:
+            self._game_screen.lock()
+            try:
+                for attack in self._attacks:
+                    attack.draw(self._game_screen)
+            finally:
+                self._game_screen.unlock()
 
     def _draw_endgame(self, finished_reason: str, winner: Optional[int]) -> None:
         _, height = self._draw_finished_reason(finished_reason)
@@ -782,13 +1077,20 @@ class Visualizer:
 
         return self._font.size(text)
 
-    def _update_map(self, phase: int) -> None:
+    def _update_map(self, phase: int) -> list[pygame.Rect]:
+        changed_rects = []
         for entity in [
             *self._food.values(),
             *self._ants.values(),
             *self._attacks,
         ]:
-            entity.update(phase, self._turn_time)
+            before = entity.rect()
+            if entity.update(phase, self._turn_time):
+                # Union the previous and current rects so moving entities are
+                # repainted at both their old and new positions
+                changed_rects.append(before.union(entity.rect()))
+
+        return changed_rects
 
     def _do_replay(self, events: list[Event]) -> None:
         for event in events:
@@ -806,38 +1108,39 @@ class Visualizer:
                 )
 
     def _replay_spawn(self, event: Event) -> None:
-        location = tuple(event.location)
+        handler = self._spawn_dispatch.get(event.entity)
 
-        if event.entity == "Ant":
-            self._ants[event.entity_id] = self._spawn_ant(
-                event.entity_id, location, event.player
-            )
-        elif event.entity == "Food":
-            self._food[location] = self._spawn_food(location)
-        else:
+        if handler is None:
             raise RuntimeError(
                 f"Invalid 'Spawn' event for entity '{event.entity}': {event}."
             )
 
+        handler(event)
+
+    def _replay_spawn_ant(self, event: Event) -> None:
+        self._ants[event.entity_id] = self._spawn_ant(
+            event.entity_id, event.location, event.player
+        )
+
+    def _replay_spawn_food(self, event: Event) -> None:
+        self._food[event.location] = self._spawn_food(event.location)
+
     def _replay_remove(self, event: Event) -> None:
         if event.entity == "Ant":
             self._ants[event.entity_id].target_size = 0
             self._ants[event.entity_id].alive = False
         elif event.entity == "Food":
-            location = tuple(event.location)
-            self._food[location].target_size = 0
-            self._food[location].alive = False
+            self._food[event.location].target_size = 0
+            self._food[event.location].alive = False
         elif event.entity == "Hill":
-            location = tuple(event.location)
             # When hills are removed they are "razed", not removed from the map
-            self._hills[location].alive = False
+            self._hills[event.location].alive = False
         else:
             raise RuntimeError(
                 f"Invalid 'Remove' event for entity '{event.entity}': {event}."
             )
 
     def _replay_move(self, event: Event) -> None:
-        to = tuple(event.destination)
         ant = self._ants.get(event.entity_id)
 
         if not ant:
@@ -846,14 +1149,14 @@ class Visualizer:
             )
 
         # Move the ant to its new location
-        ant.target_location = to
+        ant.target_location = event.destination
 
     def _replay_attack(self, event: Event) -> None:
         self._attacks.append(
             Attack(
-                location=tuple(event.location),
-                target_location=tuple(event.destination),
-                current_target_location=tuple(event.location),
+                location=event.location,
+                target_location=event.destination,
+                current_target_location=event.location,
                 scale=self._scale,
             )
         )
@@ -871,7 +1174,9 @@ class Visualizer:
 
     def _load_hill_sprites(self) -> tuple[pygame.Surface]:
         with importlib.resources.path("ants_ai.assets", "hill.png") as img_path:
-            spritesheet = pygame.image.load(str(img_path))
+            # Convert to the display format up front so blits don't pay a
+            # per-pixel conversion; requires the display to already exist
+            spritesheet = pygame.image.load(str(img_path)).convert_alpha()
             w, h = spritesheet.get_size()
             # We have 2 states (alive and razed) stacked vertically
             sprite_height = h // 2
@@ -884,53 +1189,74 @@ class Visualizer:
 
     def _load_water_sprite(self) -> pygame.Surface:
         with importlib.resources.path("ants_ai.assets", "water.png") as img_path:
-            return pygame.image.load(str(img_path))
+            return pygame.image.load(str(img_path)).convert_alpha()
 
     def _load_replay(self, replay_filename: str) -> Replay:
+        if orjson is not None:
+            with open(replay_filename, "rb") as file:
+                return Replay.from_json(orjson.loads(file.read()))
+
         with open(replay_filename, "r") as file:
             return Replay.from_json(json.load(file))
 
     def _parse_map(self) -> None:
-        regex = re.compile(r"m (.*)")
+        hills, food, water = _classify_map(self._replay.map.contents)
 
-        for row, line in enumerate(regex.finditer(self._replay.map.contents)):
-            for col, char in enumerate(line.group(1).strip()):
-                # Ignore land
-                if char == ".":
-                    continue
+        for row, col, player in hills:
+            location = (row, col)
+            self._hills[location] = Hill(
+                id=f"Hill(p={player},loc=({location}))",
+                location=location,
+                scale=self._scale,
+                alive=True,
+                player=player,
+                sprites=self._hill_sprites_for(player),
+                pixel_pos=(location[1] * self._scale, location[0] * self._scale),
+            )
 
-                location = (row, col)
-
-                # Max 10 players
-                if "0" <= char <= "9":
-                    player = int(char)
-                    sprites = [
-                        self._hill_sprites[0].copy(),
-                        self._hill_sprites[1].copy(),
-                    ]
-                    self._hills[location] = Hill(
-                        id=f"Hill(p={player},loc=({location}))",
-                        location=location,
-                        scale=self._scale,
-                        alive=True,
-                        player=player,
-                        sprites=sprites,
-                    )
-                elif char == "*":
-                    self._food[location] = self._spawn_food(location)
-                elif char == "%":
-                    self._water.append(
-                        Water(
-                            location=location,
-                            scale=self._scale,
-                            alive=True,
-                            sprite=self._water_sprite,
-                        )
-                    )
-                else:
-                    raise ValueError(
-                        f"Invalid entity in map with character value: {char}"
-                    )
+        for location in food:
+            self._food[location] = self._spawn_food(location)
+
+        for location in water:
+            self._water.append(
+                Water(
+                    location=location,
+                    scale=self._scale,
+                    alive=True,
+                    sprite=self._water_sprite,
+                    pixel_pos=(location[1] * self._scale, location[0] * self._scale),
+                )
+            )
+
+    def _hill_sprites_for(self, player: int) -> tuple[pygame.Surface]:
+        """Returns the pre-composited (alive, razed) hill sprites for a player.
+
+        The sprites are built once per player, scaled to the configured size
+        with the ownership outline drawn on the alive variant, and shared by
+        every hill the player owns.
+
+        :param player: The player that owns the hills.
+        :type player: int
+        :return: The (alive, razed) sprites for the player's hills.
+        :rtype: tuple[pygame.Surface]
+        """
+        sprites = self._hill_cache.get(player)
+
+        if sprites is None:
+            size = (self._scale, self._scale)
+            alive_sprite = pygame.transform.scale(self._hill_sprites[0], size)
+            center = (self._scale // 2, self._scale // 2)
+            radius = self._scale // 4
+            pygame.draw.circle(
+                alive_sprite, PLAYER_COLORS[player], center, radius, width=3
+            )
+            sprites = (
+                alive_sprite,
+                pygame.transform.scale(self._hill_sprites[1], size),
+            )
+            self._hill_cache[player] = sprites
+
+        return sprites
 
     def _spawn_ant(self, id: str, location: tuple[int], player: int) -> Ant:
         return Ant(
@@ -939,7 +1265,7 @@ class Visualizer:
             target_location=location,
             scale=self._scale,
             size=0,
-            target_size=self._scale // 5,
+            target_size=self._ant_target_size,
             alive=True,
             player=player,
         )
@@ -951,6 +1277,7 @@ class Visualizer:
             target_location=location,
             scale=self._scale,
             size=0,
-            target_size=self._scale // 3,
+            target_size=self._food_target_size,
             alive=True,
+            pixel_pos=(location[1] * self._scale, location[0] * self._scale),
         )